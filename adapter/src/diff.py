@@ -0,0 +1,198 @@
+"""
+Diff two DuckLake snapshots of the babynames datalake.
+
+Changes are computed from file-level metadata in the ducklake catalog:
+a data file is added when it becomes visible between the two snapshots and
+removed when it stops being visible. Delete files written in between are
+reported separately, since they remove rows without removing a data file.
+Rows kept in the catalog by data inlining (small writes such as adapter
+mappings) are counted from the ducklake_inlined_data tables.
+"""
+
+import duckdb
+import argparse
+import json
+
+METADATA = "__ducklake_metadata_babylake"
+DIFF_TABLES = ("babynames", "adapter")
+
+
+def get_current_snapshot(conn):
+    """Return the id of the latest ducklake snapshot."""
+    return conn.execute(f"""
+        SELECT MAX(snapshot_id) FROM {METADATA}.ducklake_snapshot
+    """).fetchone()[0]
+
+
+def visible_at(alias, snapshot):
+    """SQL condition for a catalog file row being visible at a snapshot."""
+    return f"""
+        {alias}.begin_snapshot <= {snapshot}
+        AND ({alias}.end_snapshot IS NULL OR {alias}.end_snapshot > {snapshot})
+    """
+
+
+def get_table_diff(conn, table_name, from_snapshot, to_snapshot):
+    """Files and row counts added/removed in a table between two snapshots.
+
+    Row counts are visible rows: a data file's record_count minus the
+    delete_count of its delete file at the relevant snapshot, plus inlined
+    rows inserted/removed in the window. Delete files are cumulative per
+    data file, so deleted_rows is the growth of the delete file between
+    `from` and `to` on data files visible at both snapshots.
+
+    Returns:
+        dict with added_files, removed_files, deleted_rows_files (lists of
+        paths), added_rows, removed_rows, deleted_rows (row counts) and
+        added_inlined_rows, removed_inlined_rows (the inlined share of
+        added_rows/removed_rows)
+    """
+    table_ids = f"""
+        SELECT table_id FROM {METADATA}.ducklake_table WHERE table_name = $table
+    """
+    params = {"table": table_name, "from": from_snapshot, "to": to_snapshot}
+
+    # Visible at `to` but not at `from`, net of deletes visible at `to`
+    added = conn.execute(f"""
+        SELECT df.path, df.record_count - COALESCE(del.delete_count, 0)
+        FROM {METADATA}.ducklake_data_file df
+        LEFT JOIN {METADATA}.ducklake_delete_file del
+          ON del.data_file_id = df.data_file_id AND {visible_at("del", "$to")}
+        WHERE df.table_id IN ({table_ids})
+          AND df.begin_snapshot > $from
+          AND {visible_at("df", "$to")}
+    """, params).fetchall()
+
+    # Visible at `from` but not at `to`, net of deletes visible at `from`
+    removed = conn.execute(f"""
+        SELECT df.path, df.record_count - COALESCE(del.delete_count, 0)
+        FROM {METADATA}.ducklake_data_file df
+        LEFT JOIN {METADATA}.ducklake_delete_file del
+          ON del.data_file_id = df.data_file_id AND {visible_at("del", "$from")}
+        WHERE df.table_id IN ({table_ids})
+          AND {visible_at("df", "$from")}
+          AND df.end_snapshot <= $to
+    """, params).fetchall()
+
+    # Delete files written in the window and still visible at `to`, on data
+    # files visible at both snapshots, minus the delete file they replaced
+    deleted = conn.execute(f"""
+        SELECT del_to.path, del_to.delete_count - COALESCE(del_from.delete_count, 0)
+        FROM {METADATA}.ducklake_delete_file del_to
+        JOIN {METADATA}.ducklake_data_file df ON del_to.data_file_id = df.data_file_id
+        LEFT JOIN {METADATA}.ducklake_delete_file del_from
+          ON del_from.data_file_id = del_to.data_file_id AND {visible_at("del_from", "$from")}
+        WHERE del_to.table_id IN ({table_ids})
+          AND del_to.begin_snapshot > $from
+          AND {visible_at("del_to", "$to")}
+          AND {visible_at("df", "$from")}
+          AND {visible_at("df", "$to")}
+    """, params).fetchall()
+
+    added_inlined, removed_inlined = get_inlined_diff(conn, table_ids, params)
+
+    return {
+        "added_files": [row[0] for row in added],
+        "removed_files": [row[0] for row in removed],
+        "deleted_rows_files": [row[0] for row in deleted],
+        "added_rows": sum(row[1] for row in added) + added_inlined,
+        "removed_rows": sum(row[1] for row in removed) + removed_inlined,
+        "deleted_rows": sum(row[1] for row in deleted),
+        "added_inlined_rows": added_inlined,
+        "removed_inlined_rows": removed_inlined,
+    }
+
+
+def get_inlined_diff(conn, table_ids, params):
+    """Inlined rows inserted and removed in a table between two snapshots.
+
+    Each inlined row carries its own begin/end snapshot, so rows are counted
+    the same way as data files.
+
+    Returns:
+        tuple: (added, removed) row counts
+    """
+    inlined_tables = [x[0] for x in conn.execute(f"""
+        SELECT table_name FROM {METADATA}.ducklake_inlined_data_tables
+        WHERE table_id IN ({table_ids})
+    """, {"table": params["table"]}).fetchall()]
+
+    window = {"from": params["from"], "to": params["to"]}
+    added = removed = 0
+    for inlined_table in inlined_tables:
+        added += conn.execute(f"""
+            SELECT COUNT(*) FROM {METADATA}.{inlined_table} r
+            WHERE r.begin_snapshot > $from AND {visible_at("r", "$to")}
+        """, window).fetchone()[0]
+        removed += conn.execute(f"""
+            SELECT COUNT(*) FROM {METADATA}.{inlined_table} r
+            WHERE {visible_at("r", "$from")} AND r.end_snapshot <= $to
+        """, window).fetchone()[0]
+
+    return added, removed
+
+
+def check_snapshots_exist(conn, *snapshot_ids):
+    """Raise ValueError if any of the snapshot ids is not in the catalog."""
+    existing = {
+        row[0] for row in conn.execute(f"""
+            SELECT snapshot_id FROM {METADATA}.ducklake_snapshot
+            WHERE snapshot_id IN (SELECT UNNEST($ids))
+        """, {"ids": list(snapshot_ids)}).fetchall()
+    }
+    missing = [s for s in snapshot_ids if s not in existing]
+    if missing:
+        raise ValueError(f"Snapshot(s) not found in ducklake: {missing}")
+
+
+def get_snapshot_diff(conn, from_snapshot, to_snapshot=None, tables=DIFF_TABLES):
+    """Diff the given tables between two snapshots.
+
+    Args:
+        from_snapshot: Snapshot id the consumer last saw
+        to_snapshot: Snapshot id to diff against (default: latest)
+
+    Returns:
+        dict with from_snapshot, to_snapshot and a per-table diff under 'tables'
+    """
+    if to_snapshot is None:
+        to_snapshot = get_current_snapshot(conn)
+        if to_snapshot is None:
+            raise ValueError("No snapshots found in ducklake")
+
+    check_snapshots_exist(conn, from_snapshot, to_snapshot)
+
+    if from_snapshot > to_snapshot:
+        raise ValueError(f"from_snapshot ({from_snapshot}) is after to_snapshot ({to_snapshot})")
+
+    return {
+        "from_snapshot": from_snapshot,
+        "to_snapshot": to_snapshot,
+        "tables": {
+            table_name: get_table_diff(conn, table_name, from_snapshot, to_snapshot)
+            for table_name in tables
+        },
+    }
+
+
+def main():
+    """Print the diff between two snapshots as JSON."""
+    parser = argparse.ArgumentParser(description="Diff two ducklake snapshots of the babynames datalake")
+    parser.add_argument('from_snapshot', type=int, help="Snapshot id to diff from")
+    parser.add_argument('to_snapshot', type=int, nargs='?', default=None,
+                        help="Snapshot id to diff to (default: latest)")
+    args = parser.parse_args()
+
+    conn = duckdb.connect()
+    try:
+        conn.execute("ATTACH 'ducklake:metadata.ducklake' AS babylake;")
+        conn.execute("USE babylake;")
+        diff = get_snapshot_diff(conn, args.from_snapshot, args.to_snapshot)
+    finally:
+        conn.close()
+
+    print(json.dumps(diff, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,9 @@ import duckdb
 import csv
 from pathlib import Path
 from collections import defaultdict
+import argparse
 import json
+from diff import get_current_snapshot, get_snapshot_diff
 
 # Load environment variables
 load_dotenv()
@@ -84,8 +86,14 @@ def get_ducklake_table_metadata(conn):
 
     return tables_metadata, ducklake_data_path
 
-def register_babynames_datalake():
-    """Register babynames dataset with the datalakes API."""
+def register_babynames_datalake(since_snapshot=None):
+    """Register babynames dataset with the datalakes API.
+
+    Args:
+        since_snapshot: Snapshot id of the previous registration. When given,
+            the payload includes the files added/removed since then so
+            downstream caches can be invalidated selectively.
+    """
 
     # Get configuration from environment variables
     dataset_id = os.getenv("DATASET_ID")
@@ -105,6 +113,12 @@ def register_babynames_datalake():
     # Get source URLs for validation
     geo_sources = get_source_urls()
 
+    # Snapshot being registered, and what changed since the previous one
+    snapshot_id = get_current_snapshot(conn)
+    changes = None
+    if since_snapshot is not None:
+        changes = get_snapshot_diff(conn, since_snapshot, snapshot_id)
+
     # Dataset metadata for registration
     dataset_metadata = {
         "dataset_id": dataset_id,
@@ -113,6 +127,10 @@ def register_babynames_datalake():
         "description": "Baby names by popularity, year, and location with entity mappings",
         "tables_metadata": file_paths,
         "ducklake_data_path": ducklake_data_path,
+        "snapshot_id": snapshot_id,
+
+        # File-level changes since `since_snapshot` (None for a full refresh)
+        "changes": changes,
 
         # Schema (for reference when building queries)
         "data_schema": schema,
@@ -172,9 +190,14 @@ def register_babynames_datalake():
 def main():
     """Run the submitter."""
 
+    parser = argparse.ArgumentParser(description="Register babynames datalake with the datalakes API")
+    parser.add_argument('--since', type=int, default=None,
+                        help="Snapshot id of the previous registration, to include changes since then")
+    args = parser.parse_args()
+
     # Get default values from environment
     dataset_id = os.getenv("DATASET_ID")
-    success = register_babynames_datalake()
+    success = register_babynames_datalake(args.since)
 
     if success:
         print(f"\n🚀 {dataset_id} datalake is now available!")
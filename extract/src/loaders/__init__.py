@@ -1,10 +1,35 @@
 """Location-specific data loaders for baby names"""
 from abc import ABC, abstractmethod
+import time
 import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# Arrow schema batches must follow to be appended to the babynames table
+BABYNAMES_SCHEMA = pa.schema([
+    ("types", pa.string()),
+    ("sex", pa.string()),
+    ("counts", pa.int32()),
+    ("year", pa.int32()),
+    ("geo", pa.string()),
+])
 
 
 class BaseLoader(ABC):
-    """Base class for all location loaders"""
+    """Base class for all location loaders
+
+    Subclasses either override load(), or implement iter_batches() yielding
+    Arrow record batches following BABYNAMES_SCHEMA and let the default
+    load() bulk-append them (for Python sources such as zip members or
+    HTTP streams).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Require subclasses to implement either load() or iter_batches()"""
+        super().__init_subclass__(**kwargs)
+        if cls.load is BaseLoader.load and not hasattr(cls, "iter_batches"):
+            raise TypeError(f"{cls.__name__} must implement either load() or iter_batches()")
 
     @property
     @abstractmethod
@@ -48,7 +73,94 @@ class BaseLoader(ABC):
 
         return False
 
-    @abstractmethod
+    def validate_batch(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Reorder and cast a batch to BABYNAMES_SCHEMA.
+
+        Raises:
+            ValueError: if the batch cannot be cast, or holds rows for a geo
+                other than this loader's (check_already_loaded would not see
+                them, so re-runs would append duplicates)
+        """
+        try:
+            batch = batch.select(BABYNAMES_SCHEMA.names).cast(BABYNAMES_SCHEMA)
+        except (KeyError, pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Batch does not match babynames schema ({batch.schema.names}): {e}"
+            ) from e
+
+        if not pc.all(pc.equal(batch["geo"], self.geo_id).fill_null(False)).as_py():
+            others = pc.unique(batch["geo"]).to_pylist()
+            raise ValueError(f"Batch has geo values {others}, expected only '{self.geo_id}'")
+
+        return batch
+
+    def append_batches(self, conn: duckdb.DuckDBPyConnection) -> int:
+        """Stream batches from iter_batches() into the babynames table.
+
+        Batches are wrapped in a RecordBatchReader and registered with DuckDB
+        without copying, so the whole input is appended in a single INSERT
+        (one snapshot) while only one batch is held in memory at a time.
+
+        Returns:
+            Number of rows appended
+
+        Raises:
+            TypeError: if the loader does not implement iter_batches()
+            ValueError: if a batch fails validate_batch(); nothing is appended
+        """
+        if not hasattr(self, "iter_batches"):
+            raise TypeError(f"{type(self).__name__} does not implement iter_batches()")
+
+        stats = {"rows": 0, "batches": 0, "error": None}
+
+        def counted(batches):
+            for batch in batches:
+                # The reader does not validate batches against the declared
+                # schema, so check each one before handing it over
+                try:
+                    batch = self.validate_batch(batch)
+                except ValueError as e:
+                    stats["error"] = e
+                    raise
+                stats["rows"] += batch.num_rows
+                stats["batches"] += 1
+                yield batch
+
+        reader = pa.RecordBatchReader.from_batches(
+            BABYNAMES_SCHEMA, counted(self.iter_batches())
+        )
+
+        start = time.perf_counter()
+        conn.register("_babynames_batches", reader)
+        try:
+            conn.execute("""
+                INSERT INTO babynames (geo, year, types, sex, counts)
+                SELECT geo, year, types, sex, counts FROM _babynames_batches
+            """)
+        except duckdb.Error as e:
+            # DuckDB wraps errors raised while scanning the reader; surface ours
+            if stats["error"] is not None:
+                raise stats["error"] from e
+            raise
+        finally:
+            conn.unregister("_babynames_batches")
+        elapsed = time.perf_counter() - start
+
+        print(f"  Appended {stats['rows']:,} rows in {stats['batches']:,} batches ({elapsed:.2f}s)")
+        return stats["rows"]
+
     def load(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Load data for this location into the database"""
-        pass
+        """Load data for this location into the database
+
+        Default implementation bulk-appends the batches from iter_batches().
+        Loaders that load directly with SQL override this instead.
+        """
+
+        # Ensure table exists with proper partitioning
+        self.ensure_table_exists(conn)
+
+        # Check if data already exists
+        if self.check_already_loaded(conn):
+            return
+
+        self.append_batches(conn)